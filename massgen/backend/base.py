@@ -9,7 +9,7 @@ from typing import Dict, List, Any, AsyncGenerator, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """Standardized chunk format for streaming responses."""
 
@@ -36,7 +36,7 @@ class StreamChunk:
     summary_index: Optional[int] = None  # Reasoning summary index
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage and cost tracking."""
 
@@ -118,6 +118,15 @@ class LLMBackend(ABC):
         """Get list of builtin tools supported by this provider."""
         return []
 
+    async def warmup(self) -> None:
+        """
+        Prepare the backend ahead of the first request (e.g. open connections).
+
+        Called in the background during startup so setup cost overlaps with
+        other work. Must never raise. Default implementation is a no-op.
+        """
+        pass
+
     def extract_tool_name(self, tool_call: Dict[str, Any]) -> str:
         """
         Extract tool name from a tool call in this backend's format.
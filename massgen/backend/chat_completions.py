@@ -50,6 +50,12 @@ class ChatCompletionsBackend(LLMBackend):
 
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         super().__init__(api_key, **kwargs)
+        # Formatted tools from the last request, reused while the tool set is unchanged
+        self._formatted_tools_source: List[Dict[str, Any]] = []
+        self._formatted_tools_key: Tuple[int, ...] = ()
+        self._formatted_tools: List[Dict[str, Any]] = []
+        # Bumped by invalidate_formatted_tools() to force the next rebuild
+        self._formatted_tools_version = 0
 
     def get_provider_name(self) -> str:
         """Get the name of this provider."""
@@ -116,6 +122,31 @@ class ChatCompletionsBackend(LLMBackend):
 
         return converted_tools
 
+    def get_formatted_tools(
+        self, tools: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Get tools in Chat Completions format, reusing the previous conversion.
+
+        Agents pass the same tool definitions on every request, so the converted
+        list is cached and only rebuilt when the set of tool objects changes.
+        The cache is keyed on object identity, so tool dicts must be treated as
+        immutable - call invalidate_formatted_tools() after changing one in place.
+        Returns a new list each call, so callers may append provider tools to it.
+        """
+        key = (self._formatted_tools_version, *map(id, tools))
+        if key != self._formatted_tools_key:
+            self._formatted_tools = self.convert_tools_to_chat_completions_format(
+                tools
+            )
+            self._formatted_tools_key = key
+            # Hold the source tools so their ids cannot be reused by new objects
+            self._formatted_tools_source = list(tools)
+        return list(self._formatted_tools)
+
+    def invalidate_formatted_tools(self) -> None:
+        """Force the next get_formatted_tools() call to rebuild the conversion."""
+        self._formatted_tools_version += 1
+
     async def handle_chat_completions_stream(
         self, stream, enable_web_search: bool = False
     ) -> AsyncGenerator[StreamChunk, None]:
@@ -325,9 +356,7 @@ class ChatCompletionsBackend(LLMBackend):
             enable_code_interpreter = all_params.get("enable_code_interpreter", False)
 
             # Convert tools to Chat Completions format
-            converted_tools = (
-                self.convert_tools_to_chat_completions_format(tools) if tools else None
-            )
+            converted_tools = self.get_formatted_tools(tools) if tools else None
 
             # Chat Completions API parameters
             api_params = {
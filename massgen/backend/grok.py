@@ -52,9 +52,7 @@ class GrokBackend(ChatCompletionsBackend):
             enable_web_search = all_params.get("enable_web_search", False)
 
             # Convert tools to Chat Completions format
-            converted_tools = (
-                self.convert_tools_to_chat_completions_format(tools) if tools else None
-            )
+            converted_tools = self.get_formatted_tools(tools) if tools else None
 
             # Chat Completions API parameters
             api_params = {
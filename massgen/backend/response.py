@@ -5,10 +5,187 @@ Response API backend implementation.
 Standalone implementation optimized for the standard Response API format (originated by OpenAI).
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-from typing import Dict, List, Any, AsyncGenerator, Optional
+import re
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import httpx
+import openai
+
 from .base import LLMBackend, StreamChunk
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# High-frequency Response API stream event types. Dotted names are not
+# auto-interned by CPython, so intern them once for cheaper comparisons.
+_OUTPUT_TEXT_DELTA = sys.intern("response.output_text.delta")
+_REASONING_TEXT_DELTA = sys.intern("response.reasoning_text.delta")
+_REASONING_SUMMARY_TEXT_DELTA = sys.intern("response.reasoning_summary_text.delta")
+_RESPONSE_COMPLETED = sys.intern("response.completed")
+
+# Progress messages for provider tool stream events that carry no payload
+_PROVIDER_TOOL_STATUS_MESSAGES = {
+    "response.web_search_call.in_progress": "\n🔍 [Provider Tool: Web Search] Starting search...",
+    "response.web_search_call.searching": "\n🔍 [Provider Tool: Web Search] Searching...",
+    "response.web_search_call.completed": "\n✅ [Provider Tool: Web Search] Search completed",
+    "response.code_interpreter_call.in_progress": "\n💻 [Provider Tool: Code Interpreter] Starting execution...",
+    "response.code_interpreter_call.executing": "\n💻 [Provider Tool: Code Interpreter] Executing...",
+    "response.code_interpreter_call.completed": "\n✅ [Provider Tool: Code Interpreter] Execution completed",
+}
+
+# Buffered output text is flushed once it reaches this size or age
+TEXT_FLUSH_MAX_CHARS = 256
+TEXT_FLUSH_INTERVAL_SECONDS = 0.02
+
+# Provider tool specs, built once and shared by every request (never mutated)
+_PROVIDER_TOOL_SPECS: Dict[str, Dict[str, Any]] = {
+    "web_search": {"type": "web_search"},
+    "code_interpreter": {"type": "code_interpreter", "container": {"type": "auto"}},
+}
+
+# Maximum number of responses kept per backend when enable_response_cache is set
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Response output item types that can be replayed from the response cache
+_CACHEABLE_OUTPUT_TYPES = frozenset({"message", "reasoning"})
+
+# Reasoning effort levels accepted as o-series model name suffixes
+_REASONING_EFFORTS = frozenset({"low", "medium", "high"})
+
+# o-series model names (o1, o3-mini, o4-mini, ...) that take an effort suffix
+_O_SERIES_MODEL_PATTERN = re.compile(r"o\d[\w.-]*")
+
+# Upper bound on the connection warmup request made by ResponseBackend.warmup
+WARMUP_TIMEOUT_SECONDS = 2.0
+
+# OpenAI pricing in USD per 1K tokens as (input, output)
+_PRICING_PER_1K = {
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4o": (0.005, 0.020),
+    "gpt-4": (0.03, 0.06),
+    "gpt-3.5": (0.0005, 0.0015),
+}
+
+# Same table converted to USD per token at import time
+_PER_TOKEN_PRICING = {
+    name: (input_rate / 1000, output_rate / 1000)
+    for name, (input_rate, output_rate) in _PRICING_PER_1K.items()
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _get_per_token_rates(model: str) -> Tuple[float, float]:
+    """Resolve a model name to its per-token (input, output) rates."""
+    model_lower = model.lower()
+
+    if "gpt-4" in model_lower:
+        if "4o-mini" in model_lower:
+            return _PER_TOKEN_PRICING["gpt-4o-mini"]
+        if "4o" in model_lower:
+            return _PER_TOKEN_PRICING["gpt-4o"]
+        return _PER_TOKEN_PRICING["gpt-4"]
+    # gpt-3.5 pricing doubles as the default for unknown models
+    return _PER_TOKEN_PRICING["gpt-3.5"]
+
+
+# Shared AsyncOpenAI clients keyed by event loop, then API key. httpx connection
+# pools are bound to the loop they were created on, so clients are only shared
+# between backends running on the same loop.
+_CLIENT_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class _OrjsonAsyncHttpxClient(openai.DefaultAsyncHttpxClient):
+    """httpx client that encodes JSON request bodies with orjson.
+
+    Long conversation histories make the request body large, and orjson
+    serializes it several times faster than the stdlib json used by httpx.
+    """
+
+    def build_request(self, method, url, *, json=None, content=None, **kwargs):
+        # Multipart requests (file uploads) pass files/data and must keep their body
+        if (
+            json is not None
+            and content is None
+            and not kwargs.get("files")
+            and not kwargs.get("data")
+        ):
+            try:
+                content = orjson.dumps(json)
+            except TypeError:
+                # Payload orjson can't encode - let httpx handle it
+                pass
+            else:
+                headers = httpx.Headers(kwargs.pop("headers", None))
+                headers.setdefault("Content-Type", "application/json")
+                kwargs["headers"] = headers
+                json = None
+        return super().build_request(
+            method, url, json=json, content=content, **kwargs
+        )
+
+
+def _get_shared_client(api_key: Optional[str]) -> openai.AsyncOpenAI:
+    """Get the AsyncOpenAI client shared by all backends using this API key."""
+    clients = _CLIENT_CACHE.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        http_client_class = (
+            _OrjsonAsyncHttpxClient
+            if ORJSON_AVAILABLE
+            else openai.DefaultAsyncHttpxClient
+        )
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=http_client_class(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+            ),
+        )
+        clients[api_key] = client
+    return client
+
+
+def _request_cache_key(api_params: Dict[str, Any]) -> bytes:
+    """Hash the full request parameters into a compact response cache key."""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(api_params, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        payload = json.dumps(api_params, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=128)
+def _split_reasoning_effort(model: str) -> Tuple[str, Optional[str]]:
+    """Split an o-series model name like "o3-high" into ("o3", "high").
+
+    Models without a reasoning effort suffix are returned unchanged with no effort.
+    """
+    base, _, suffix = model.rpartition("-")
+    if suffix in _REASONING_EFFORTS and _O_SERIES_MODEL_PATTERN.fullmatch(base):
+        return base, suffix
+    return model, None
+
 
 class ResponseBackend(LLMBackend):
     """Backend using the standard Response API format."""
@@ -17,6 +194,11 @@ class ResponseBackend(LLMBackend):
         super().__init__(api_key, **kwargs)
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
 
+        # Opt-in LRU cache of completed text-only responses, keyed by request
+        self._response_cache: OrderedDict = OrderedDict()
+        self.response_cache_hits = 0
+        self.response_cache_misses = 0
+
     def convert_tools_to_response_api_format(
         self, tools: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -30,7 +212,11 @@ class ResponseBackend(LLMBackend):
 
         converted_tools = []
         for tool in tools:
-            if tool.get("type") == "function" and "function" in tool:
+            tool_type = tool.get("type")
+            if tool_type in _PROVIDER_TOOL_SPECS and len(tool) == 1:
+                # Bare builtin tool reference - use the shared full spec
+                converted_tools.append(_PROVIDER_TOOL_SPECS[tool_type])
+            elif tool_type == "function" and "function" in tool:
                 # Chat Completions format - convert to Response API format
                 func = tool["function"]
                 converted_tools.append(
@@ -57,44 +243,34 @@ class ResponseBackend(LLMBackend):
 
         Note: Assistant messages with tool_calls should not be in input - they're generated by the backend.
         """
-        import json
-
-        # First pass: remove 'status' from messages without 'role'
-        cleaned_messages = []
-        for i, message in enumerate(messages):
-            if "status" in message and "role" not in message:
-                # Create a copy without 'status'
-                cleaned_message = {k: v for k, v in message.items() if k != "status"}
-                cleaned_messages.append(cleaned_message)
-            else:
-                cleaned_messages.append(message)
-
         converted_messages = []
 
-        for i, message in enumerate(cleaned_messages):
+        # Single pass: strip 'status' from messages without 'role', then convert
+        for message in messages:
+            if "status" in message and "role" not in message:
+                message = {k: v for k, v in message.items() if k != "status"}
 
-            # Check if 'status' field exists
-            if message.get("role") == "tool":
+            role = message.get("role")
+            if role == "tool":
                 # Convert Chat Completions tool message to Response API format
-                converted_message = {
-                    "type": "function_call_output",
-                    "call_id": message.get("tool_call_id"),
-                    "output": message.get("content", ""),
-                }
-                converted_messages.append(converted_message)
+                converted_messages.append(
+                    {
+                        "type": "function_call_output",
+                        "call_id": message.get("tool_call_id"),
+                        "output": message.get("content", ""),
+                    }
+                )
             elif message.get("type") == "function_call_output":
                 converted_messages.append(message)
-            elif message.get("role") == "assistant" and "tool_calls" in message:
+            elif role == "assistant" and "tool_calls" in message:
                 # Assistant message with tool_calls in native Responses API format
                 # Remove tool_calls when sending as input - only results should be sent back
-                cleaned_message = {
-                    k: v for k, v in message.items() if k != "tool_calls"
-                }
-                converted_messages.append(cleaned_message)
+                converted_messages.append(
+                    {k: v for k, v in message.items() if k != "tool_calls"}
+                )
             else:
-                # For other message types, just ensure they have an id
-                filtered_message = message.copy()
-                converted_messages.append(filtered_message)
+                # For other message types, pass through a shallow copy
+                converted_messages.append(message.copy())
         return converted_messages
 
     async def stream_with_tools(
@@ -102,9 +278,7 @@ class ResponseBackend(LLMBackend):
     ) -> AsyncGenerator[StreamChunk, None]:
         """Stream response using OpenAI Response API."""
         try:
-            import openai
-
-            client = openai.AsyncOpenAI(api_key=self.api_key)
+            client = _get_shared_client(self.api_key)
 
             # Merge constructor config with stream kwargs (stream kwargs take priority)
             all_params = {**self.config, **kwargs}
@@ -123,6 +297,7 @@ class ResponseBackend(LLMBackend):
             excluded_params = {
                 "enable_web_search",
                 "enable_code_interpreter",
+                "enable_response_cache",
                 "agent_id",
                 "session_id",
             }
@@ -134,6 +309,19 @@ class ResponseBackend(LLMBackend):
                     else:
                         api_params[key] = value
 
+            # o-series models may carry a reasoning effort suffix (e.g. "o3-high")
+            if "model" in api_params:
+                api_model, reasoning_effort = _split_reasoning_effort(
+                    api_params["model"]
+                )
+                api_params["model"] = api_model
+                if reasoning_effort:
+                    # An explicit effort in the reasoning config takes priority
+                    api_params["reasoning"] = {
+                        "effort": reasoning_effort,
+                        **api_params.get("reasoning", {}),
+                    }
+
             # Add framework tools (convert to Response API format)
             if tools:
                 converted_tools = self.convert_tools_to_response_api_format(tools)
@@ -142,166 +330,75 @@ class ResponseBackend(LLMBackend):
             # Add provider tools (web search, code interpreter) if enabled
             provider_tools = []
             if enable_web_search:
-                provider_tools.append({"type": "web_search"})
+                provider_tools.append(_PROVIDER_TOOL_SPECS["web_search"])
 
             if enable_code_interpreter:
-                provider_tools.append(
-                    {"type": "code_interpreter", "container": {"type": "auto"}}
-                )
+                provider_tools.append(_PROVIDER_TOOL_SPECS["code_interpreter"])
 
             if provider_tools:
                 if "tools" not in api_params:
                     api_params["tools"] = []
                 api_params["tools"].extend(provider_tools)
 
+            # Replay an identical earlier request from the cache if enabled
+            cache_key = None
+            if all_params.get("enable_response_cache", False):
+                cache_key = _request_cache_key(api_params)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    self.response_cache_hits += 1
+                    cached_text, cached_response = cached
+                    if cached_text:
+                        yield StreamChunk(type="content", content=cached_text)
+                    yield StreamChunk(
+                        type="complete_response", response=cached_response
+                    )
+                    yield StreamChunk(type="done")
+                    return
+                self.response_cache_misses += 1
+
             stream = await client.responses.create(**api_params)
 
             content = ""
 
+            # Text deltas are coalesced and emitted in batches to cut per-token overhead
+            pending_text: List[str] = []
+            pending_length = 0
+            last_flush = time.monotonic()
+
             async for chunk in stream:
                 # Handle Responses API streaming format
                 if hasattr(chunk, "type"):
-                    if chunk.type == "response.output_text.delta" and hasattr(
-                        chunk, "delta"
-                    ):
+                    chunk_type = chunk.type
+                    if pending_text and chunk_type != _OUTPUT_TEXT_DELTA:
+                        # Flush buffered text before any other event to keep ordering
+                        yield StreamChunk(type="content", content="".join(pending_text))
+                        pending_text.clear()
+                        pending_length = 0
+                        last_flush = time.monotonic()
+
+                    if chunk_type == _OUTPUT_TEXT_DELTA and hasattr(chunk, "delta"):
                         content += chunk.delta
-                        yield StreamChunk(type="content", content=chunk.delta)
-                    elif chunk.type == "response.reasoning_text.delta" and hasattr(
-                        chunk, "delta"
-                    ):
-                        # Stream reasoning process as it develops
-                        yield StreamChunk(
-                            type="reasoning",
-                            content=f"🧠 [Reasoning] {chunk.delta}",
-                            reasoning_delta=chunk.delta,
-                            item_id=getattr(chunk, "item_id", None),
-                            content_index=getattr(chunk, "content_index", None),
-                        )
-                    elif chunk.type == "response.reasoning_text.done":
-                        # Complete reasoning step finished
-                        reasoning_text = getattr(chunk, "text", "")
-                        yield StreamChunk(
-                            type="reasoning_done",
-                            content=f"\n🧠 [Reasoning Complete]\n",
-                            reasoning_text=reasoning_text,
-                            item_id=getattr(chunk, "item_id", None),
-                            content_index=getattr(chunk, "content_index", None),
-                        )
-                    elif (
-                        chunk.type == "response.reasoning_summary_text.delta"
-                        and hasattr(chunk, "delta")
-                    ):
-                        # Stream reasoning summary as it develops
-                        yield StreamChunk(
-                            type="reasoning_summary",
-                            content=chunk.delta,  # Raw delta content without prefix
-                            reasoning_summary_delta=chunk.delta,
-                            item_id=getattr(chunk, "item_id", None),
-                            summary_index=getattr(chunk, "summary_index", None),
-                        )
-                    elif chunk.type == "response.reasoning_summary_text.done":
-                        # Complete reasoning summary finished
-                        summary_text = getattr(chunk, "text", "")
-                        yield StreamChunk(
-                            type="reasoning_summary_done",
-                            content=f"\n📋 [Reasoning Summary Complete]\n",
-                            reasoning_summary_text=summary_text,
-                            item_id=getattr(chunk, "item_id", None),
-                            summary_index=getattr(chunk, "summary_index", None),
-                        )
-                    elif chunk.type == "response.web_search_call.in_progress":
-                        yield StreamChunk(
-                            type="content",
-                            content=f"\n🔍 [Provider Tool: Web Search] Starting search...",
-                        )
-                    elif chunk.type == "response.web_search_call.searching":
-                        yield StreamChunk(
-                            type="content",
-                            content=f"\n🔍 [Provider Tool: Web Search] Searching...",
-                        )
-                    elif chunk.type == "response.web_search_call.completed":
-                        yield StreamChunk(
-                            type="content",
-                            content=f"\n✅ [Provider Tool: Web Search] Search completed",
-                        )
-                    elif chunk.type == "response.code_interpreter_call.in_progress":
-                        yield StreamChunk(
-                            type="content",
-                            content=f"\n💻 [Provider Tool: Code Interpreter] Starting execution...",
-                        )
-                    elif chunk.type == "response.code_interpreter_call.executing":
-                        yield StreamChunk(
-                            type="content",
-                            content=f"\n💻 [Provider Tool: Code Interpreter] Executing...",
-                        )
-                    elif chunk.type == "response.code_interpreter_call.completed":
-                        yield StreamChunk(
-                            type="content",
-                            content=f"\n✅ [Provider Tool: Code Interpreter] Execution completed",
-                        )
-                    elif chunk.type == "response.output_item.done":
-                        # Get search query or executed code details - show them right after completion
-                        if hasattr(chunk, "item") and chunk.item:
-                            if (
-                                hasattr(chunk.item, "type")
-                                and chunk.item.type == "web_search_call"
-                            ):
-                                if hasattr(chunk.item, "action") and (
-                                    "query" in chunk.item.action
-                                ):
-                                    search_query = chunk.item.action["query"]
-                                    if search_query:
-                                        yield StreamChunk(
-                                            type="content",
-                                            content=f"\n🔍 [Search Query] '{search_query}'\n",
-                                        )
-                            elif (
-                                hasattr(chunk.item, "type")
-                                and chunk.item.type == "code_interpreter_call"
-                            ):
-                                if hasattr(chunk.item, "code") and chunk.item.code:
-                                    # Format code as a proper code block - don't assume language
-                                    yield StreamChunk(
-                                        type="content",
-                                        content=f"💻 [Code Executed]\n```\n{chunk.item.code}\n```\n",
-                                    )
-
-                                # Also show the execution output if available
-                                if (
-                                    hasattr(chunk.item, "outputs")
-                                    and chunk.item.outputs
-                                ):
-                                    for output in chunk.item.outputs:
-                                        output_text = None
-                                        if hasattr(output, "text") and output.text:
-                                            output_text = output.text
-                                        elif (
-                                            hasattr(output, "content")
-                                            and output.content
-                                        ):
-                                            output_text = output.content
-                                        elif hasattr(output, "data") and output.data:
-                                            output_text = str(output.data)
-                                        elif isinstance(output, str):
-                                            output_text = output
-                                        elif isinstance(output, dict):
-                                            # Handle dict format outputs
-                                            if "text" in output:
-                                                output_text = output["text"]
-                                            elif "content" in output:
-                                                output_text = output["content"]
-                                            elif "data" in output:
-                                                output_text = str(output["data"])
-
-                                        if output_text and output_text.strip():
-                                            yield StreamChunk(
-                                                type="content",
-                                                content=f"📊 [Result] {output_text.strip()}\n",
-                                            )
-                    elif chunk.type == "response.completed":
+                        pending_text.append(chunk.delta)
+                        pending_length += len(chunk.delta)
+                        now = time.monotonic()
+                        if (
+                            pending_length >= TEXT_FLUSH_MAX_CHARS
+                            or now - last_flush >= TEXT_FLUSH_INTERVAL_SECONDS
+                        ):
+                            yield StreamChunk(
+                                type="content", content="".join(pending_text)
+                            )
+                            pending_text.clear()
+                            pending_length = 0
+                            last_flush = now
+                    elif chunk_type == _RESPONSE_COMPLETED:
                         # Extract and yield tool calls from the complete response
                         if hasattr(chunk, "response"):
                             response_dict = self._convert_to_dict(chunk.response)
+                            if cache_key is not None:
+                                self._cache_response(cache_key, content, response_dict)
 
                             # Handle builtin tool results from output array with simple content format
                             if (
@@ -363,10 +460,167 @@ class ResponseBackend(LLMBackend):
 
                         # Signal completion
                         yield StreamChunk(type="done")
+                    else:
+                        handler = self._STREAM_EVENT_HANDLERS.get(chunk_type)
+                        if handler is not None:
+                            for stream_chunk in handler(self, chunk):
+                                yield stream_chunk
+
+            # Stream ended without a completion event - emit any remaining text
+            if pending_text:
+                yield StreamChunk(type="content", content="".join(pending_text))
 
         except Exception as e:
             yield StreamChunk(type="error", error=str(e))
 
+    def _handle_reasoning_text_delta(self, chunk) -> Iterator[StreamChunk]:
+        """Stream reasoning process as it develops."""
+        if hasattr(chunk, "delta"):
+            yield StreamChunk(
+                type="reasoning",
+                content=f"🧠 [Reasoning] {chunk.delta}",
+                reasoning_delta=chunk.delta,
+                item_id=getattr(chunk, "item_id", None),
+                content_index=getattr(chunk, "content_index", None),
+            )
+
+    def _handle_reasoning_text_done(self, chunk) -> Iterator[StreamChunk]:
+        """Signal that a complete reasoning step finished."""
+        reasoning_text = getattr(chunk, "text", "")
+        yield StreamChunk(
+            type="reasoning_done",
+            content=f"\n🧠 [Reasoning Complete]\n",
+            reasoning_text=reasoning_text,
+            item_id=getattr(chunk, "item_id", None),
+            content_index=getattr(chunk, "content_index", None),
+        )
+
+    def _handle_reasoning_summary_text_delta(self, chunk) -> Iterator[StreamChunk]:
+        """Stream reasoning summary as it develops."""
+        if hasattr(chunk, "delta"):
+            yield StreamChunk(
+                type="reasoning_summary",
+                content=chunk.delta,  # Raw delta content without prefix
+                reasoning_summary_delta=chunk.delta,
+                item_id=getattr(chunk, "item_id", None),
+                summary_index=getattr(chunk, "summary_index", None),
+            )
+
+    def _handle_reasoning_summary_text_done(self, chunk) -> Iterator[StreamChunk]:
+        """Signal that the complete reasoning summary finished."""
+        summary_text = getattr(chunk, "text", "")
+        yield StreamChunk(
+            type="reasoning_summary_done",
+            content=f"\n📋 [Reasoning Summary Complete]\n",
+            reasoning_summary_text=summary_text,
+            item_id=getattr(chunk, "item_id", None),
+            summary_index=getattr(chunk, "summary_index", None),
+        )
+
+    def _handle_provider_tool_status(self, chunk) -> Iterator[StreamChunk]:
+        """Report web search / code interpreter progress."""
+        yield StreamChunk(
+            type="content", content=_PROVIDER_TOOL_STATUS_MESSAGES[chunk.type]
+        )
+
+    def _handle_output_item_done(self, chunk) -> Iterator[StreamChunk]:
+        """Show search query or executed code details right after completion."""
+        if not (hasattr(chunk, "item") and chunk.item):
+            return
+        if hasattr(chunk.item, "type") and chunk.item.type == "web_search_call":
+            if hasattr(chunk.item, "action") and ("query" in chunk.item.action):
+                search_query = chunk.item.action["query"]
+                if search_query:
+                    yield StreamChunk(
+                        type="content",
+                        content=f"\n🔍 [Search Query] '{search_query}'\n",
+                    )
+        elif hasattr(chunk.item, "type") and chunk.item.type == "code_interpreter_call":
+            if hasattr(chunk.item, "code") and chunk.item.code:
+                # Format code as a proper code block - don't assume language
+                yield StreamChunk(
+                    type="content",
+                    content=f"💻 [Code Executed]\n```\n{chunk.item.code}\n```\n",
+                )
+
+            # Also show the execution output if available
+            if hasattr(chunk.item, "outputs") and chunk.item.outputs:
+                for output in chunk.item.outputs:
+                    output_text = None
+                    if hasattr(output, "text") and output.text:
+                        output_text = output.text
+                    elif hasattr(output, "content") and output.content:
+                        output_text = output.content
+                    elif hasattr(output, "data") and output.data:
+                        output_text = str(output.data)
+                    elif isinstance(output, str):
+                        output_text = output
+                    elif isinstance(output, dict):
+                        # Handle dict format outputs
+                        if "text" in output:
+                            output_text = output["text"]
+                        elif "content" in output:
+                            output_text = output["content"]
+                        elif "data" in output:
+                            output_text = str(output["data"])
+
+                    if output_text and output_text.strip():
+                        yield StreamChunk(
+                            type="content",
+                            content=f"📊 [Result] {output_text.strip()}\n",
+                        )
+
+    # Stateless stream event handlers, dispatched by event type. Text deltas and
+    # response.completed carry per-stream state and are handled inline.
+    _STREAM_EVENT_HANDLERS: Dict[str, Callable[..., Iterator[StreamChunk]]] = {
+        _REASONING_TEXT_DELTA: _handle_reasoning_text_delta,
+        "response.reasoning_text.done": _handle_reasoning_text_done,
+        _REASONING_SUMMARY_TEXT_DELTA: _handle_reasoning_summary_text_delta,
+        "response.reasoning_summary_text.done": _handle_reasoning_summary_text_done,
+        "response.output_item.done": _handle_output_item_done,
+        **dict.fromkeys(_PROVIDER_TOOL_STATUS_MESSAGES, _handle_provider_tool_status),
+    }
+
+    def _cache_response(
+        self, cache_key: bytes, text: str, response_dict: Dict[str, Any]
+    ) -> None:
+        """Store a completed response if it is safe to replay.
+
+        Only plain text responses are cached; responses containing tool calls
+        or provider tool results must always come from the API.
+        """
+        output = (
+            response_dict.get("output") if isinstance(response_dict, dict) else None
+        )
+        if not isinstance(output, list) or any(
+            item.get("type") not in _CACHEABLE_OUTPUT_TYPES for item in output
+        ):
+            return
+        self._response_cache[cache_key] = (text, response_dict)
+        self._response_cache.move_to_end(cache_key)
+        if len(self._response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+
+    def clear_response_cache(self) -> None:
+        """Drop all cached responses and reset hit/miss counters."""
+        self._response_cache.clear()
+        self.response_cache_hits = 0
+        self.response_cache_misses = 0
+
+    async def warmup(self) -> None:
+        """Open a pooled connection to the API before the first request.
+
+        Issues a cheap model listing so the TCP+TLS handshake is done ahead of
+        time. Errors are ignored - the first real request just connects itself.
+        """
+        try:
+            client = _get_shared_client(self.api_key)
+            await client.with_options(
+                max_retries=0, timeout=WARMUP_TIMEOUT_SECONDS
+            ).models.list()
+        except Exception:
+            pass
+
     def get_provider_name(self) -> str:
         """Get the provider name."""
         return "OpenAI"
@@ -445,23 +699,5 @@ class ResponseBackend(LLMBackend):
         self, input_tokens: int, output_tokens: int, model: str
     ) -> float:
         """Calculate cost for OpenAI token usage (2024-2025 pricing)."""
-        model_lower = model.lower()
-
-        if "gpt-4" in model_lower:
-            if "4o-mini" in model_lower:
-                input_cost = input_tokens * 0.00015 / 1000
-                output_cost = output_tokens * 0.0006 / 1000
-            elif "4o" in model_lower:
-                input_cost = input_tokens * 0.005 / 1000
-                output_cost = output_tokens * 0.020 / 1000
-            else:
-                input_cost = input_tokens * 0.03 / 1000
-                output_cost = output_tokens * 0.06 / 1000
-        elif "gpt-3.5" in model_lower:
-            input_cost = input_tokens * 0.0005 / 1000
-            output_cost = output_tokens * 0.0015 / 1000
-        else:
-            input_cost = input_tokens * 0.0005 / 1000
-            output_cost = output_tokens * 0.0015 / 1000
-
-        return input_cost + output_cost
+        input_rate, output_rate = _get_per_token_rates(model)
+        return input_tokens * input_rate + output_tokens * output_rate
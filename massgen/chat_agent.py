@@ -132,6 +132,8 @@ class SingleAgent(ChatAgent):
         self.backend = backend
         self.agent_id = agent_id or f"agent_{uuid.uuid4().hex[:8]}"
         self.system_message = system_message
+        # Provider name is fixed for the backend's lifetime; cache it for get_status
+        self._provider_name = backend.get_provider_name()
 
         # Add system message to history if provided
         if self.system_message:
@@ -149,18 +151,20 @@ class SingleAgent(ChatAgent):
 
         try:
             async for chunk in backend_stream:
-                if chunk.type == "content":
+                # Chunk type literals are interned, so these compares are identity checks
+                chunk_type = chunk.type
+                if chunk_type == "content":
                     assistant_response += chunk.content
                     yield chunk
-                elif chunk.type == "tool_calls":
+                elif chunk_type == "tool_calls":
                     chunk_tool_calls = getattr(chunk, "tool_calls", []) or []
                     tool_calls.extend(chunk_tool_calls)
                     yield chunk
-                elif chunk.type == "complete_message":
+                elif chunk_type == "complete_message":
                     # Backend provided the complete message structure
                     complete_message = chunk.complete_message
                     # Don't yield this - it's for internal use
-                elif chunk.type == "complete_response":
+                elif chunk_type == "complete_response":
                     # Backend provided the raw Responses API response
                     if chunk.response:
                         complete_message = chunk.response
@@ -184,7 +188,7 @@ class SingleAgent(ChatAgent):
                                     type="tool_calls", tool_calls=response_tool_calls
                                 )
                     # Complete response is for internal use - don't yield it
-                elif chunk.type == "done":
+                elif chunk_type == "done":
                     # Add complete response to history
                     if complete_message:
                         # For Responses API: complete_message is the response object with 'output' array
@@ -269,12 +273,20 @@ class SingleAgent(ChatAgent):
 
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status."""
+        token_usage = self.backend.token_usage
         return {
             "agent_type": "single",
             "agent_id": self.agent_id,
             "session_id": self.session_id,
             "system_message": self.system_message,
             "conversation_length": len(self.conversation_history),
+            "provider": self._provider_name,
+            "token_usage": {
+                "input_tokens": token_usage.input_tokens,
+                "output_tokens": token_usage.output_tokens,
+                "total_tokens": token_usage.input_tokens + token_usage.output_tokens,
+                "estimated_cost": token_usage.estimated_cost,
+            },
         }
 
     async def reset(self) -> None:
@@ -359,10 +371,15 @@ class ConfigurableAgent(SingleAgent):
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status with config details."""
         status = super().get_status()
+        config = self.config.to_dict()
+        # Don't expose credentials (or the live params dict) through status
+        config["backend_params"] = {
+            k: v for k, v in config["backend_params"].items() if k != "api_key"
+        }
         status.update(
             {
                 "agent_type": "configurable",
-                "config": self.config.to_dict(),
+                "config": config,
                 "capabilities": {
                     "web_search": self.config.backend_params.get(
                         "enable_web_search", False
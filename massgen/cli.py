@@ -26,10 +26,10 @@ import os
 import sys
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 
 from .utils import get_backend_type_from_model
-from .backend.response import ResponseBackend
+from .backend.response import ResponseBackend, WARMUP_TIMEOUT_SECONDS
 from .backend.grok import GrokBackend
 from .backend.claude import ClaudeBackend
 from .backend.gemini import GeminiBackend
@@ -112,6 +112,127 @@ def load_config_file(config_path: str) -> Dict[str, Any]:
         raise ConfigurationError(f"Error reading config file: {e}")
 
 
+# Registry of backend factories keyed by lowercase backend type
+_BACKEND_FACTORIES: Dict[str, Callable[..., Any]] = {}
+
+
+def register_backend(*backend_types: str) -> Callable:
+    """Register a backend factory for one or more backend types.
+
+    Usage:
+        @register_backend("openai")
+        def _create_openai_backend(**kwargs):
+            ...
+    """
+
+    def decorator(factory: Callable[..., Any]) -> Callable[..., Any]:
+        for backend_type in backend_types:
+            _BACKEND_FACTORIES[backend_type.lower()] = factory
+        return factory
+
+    return decorator
+
+
+@register_backend("openai")
+def _create_openai_backend(**kwargs) -> ResponseBackend:
+    api_key = kwargs.get("api_key") or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ConfigurationError(
+            "OpenAI API key not found. Set OPENAI_API_KEY or provide " "in config."
+        )
+    return ResponseBackend(api_key=api_key)
+
+
+@register_backend("grok")
+def _create_grok_backend(**kwargs) -> GrokBackend:
+    api_key = kwargs.get("api_key") or os.getenv("XAI_API_KEY")
+    if not api_key:
+        raise ConfigurationError(
+            "Grok API key not found. Set XAI_API_KEY or provide in config."
+        )
+    return GrokBackend(api_key=api_key)
+
+
+@register_backend("claude")
+def _create_claude_backend(**kwargs) -> ClaudeBackend:
+    api_key = kwargs.get("api_key") or os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ConfigurationError(
+            "Claude API key not found. Set ANTHROPIC_API_KEY or provide in config."
+        )
+    return ClaudeBackend(api_key=api_key)
+
+
+@register_backend("gemini")
+def _create_gemini_backend(**kwargs) -> GeminiBackend:
+    api_key = (
+        kwargs.get("api_key")
+        or os.getenv("GOOGLE_API_KEY")
+        or os.getenv("GEMINI_API_KEY")
+    )
+    if not api_key:
+        raise ConfigurationError(
+            "Gemini API key not found. Set GOOGLE_API_KEY or provide in config."
+        )
+    return GeminiBackend(api_key=api_key)
+
+
+@register_backend("chatcompletion")
+def _create_chatcompletion_backend(**kwargs) -> ChatCompletionsBackend:
+    api_key = kwargs.get("api_key")
+    base_url = kwargs.get("base_url")
+
+    # Determine API key based on base URL if not explicitly provided
+    if not api_key:
+        if base_url and "cerebras.ai" in base_url:
+            api_key = os.getenv("CEREBRAS_API_KEY")
+            if not api_key:
+                raise ConfigurationError(
+                    "Cerebras AI API key not found. Set CEREBRAS_API_KEY or provide in config."
+                )
+        elif base_url and "z.ai" in base_url:
+            api_key = os.getenv("ZAI_API_KEY")
+            if not api_key:
+                raise ConfigurationError(
+                    "ZAI API key not found. Set ZAI_API_KEY or provide in config."
+                )
+
+    return ChatCompletionsBackend(api_key=api_key)
+
+
+@register_backend("zai")
+def _create_zai_backend(**kwargs) -> ChatCompletionsBackend:
+    # ZAI uses OpenAI-compatible Chat Completions at a custom base_url
+    api_key = kwargs.get("api_key") or os.getenv("ZAI_API_KEY")
+    if not api_key:
+        raise ConfigurationError(
+            "ZAI API key not found. Set ZAI_API_KEY or provide in config."
+        )
+    return ChatCompletionsBackend(api_key=api_key)
+
+
+@register_backend("lmstudio")
+def _create_lmstudio_backend(**kwargs) -> LMStudioBackend:
+    # LM Studio local server (OpenAI-compatible). Defaults handled by backend.
+    return LMStudioBackend(**kwargs)
+
+
+@register_backend("claude_code")
+def _create_claude_code_backend(**kwargs) -> ClaudeCodeBackend:
+    # ClaudeCodeBackend using claude-code-sdk-python
+    # Authentication handled by backend (API key or subscription)
+
+    # Validate claude-code-sdk availability
+    try:
+        import claude_code_sdk
+    except ImportError:
+        raise ConfigurationError(
+            "claude-code-sdk not found. Install with: pip install claude-code-sdk"
+        )
+
+    return ClaudeCodeBackend(**kwargs)
+
+
 def create_backend(backend_type: str, **kwargs) -> Any:
     """Create backend instance from type and parameters.
 
@@ -121,6 +242,9 @@ def create_backend(backend_type: str, **kwargs) -> Any:
     - claude: Anthropic Claude (requires ANTHROPIC_API_KEY)
     - gemini: Google Gemini (requires GOOGLE_API_KEY or GEMINI_API_KEY)
     - chatcompletion: OpenAI-compatible providers (auto-detects API key based on base_url)
+    - zai: ZAI (requires ZAI_API_KEY)
+    - lmstudio: LM Studio local server
+    - claude_code: Claude Code (requires claude-code-sdk)
 
     For chatcompletion backend, the following providers are auto-detected:
     - Cerebras AI (cerebras.ai) -> CEREBRAS_API_KEY
@@ -129,99 +253,33 @@ def create_backend(backend_type: str, **kwargs) -> Any:
     - Groq (groq.com) -> GROQ_API_KEY
     - Nebius AI Studio (studio.nebius.ai) -> NEBIUS_API_KEY
     - OpenRouter (openrouter.ai) -> OPENROUTER_API_KEY
+
+    Additional backend types can be added with @register_backend.
     """
     backend_type = backend_type.lower()
 
-    if backend_type == "openai":
-        api_key = kwargs.get("api_key") or os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ConfigurationError(
-                "OpenAI API key not found. Set OPENAI_API_KEY or provide " "in config."
-            )
-        return ResponseBackend(api_key=api_key)
+    factory = _BACKEND_FACTORIES.get(backend_type)
+    if factory is None:
+        raise ConfigurationError(f"Unsupported backend type: {backend_type}")
+    return factory(**kwargs)
 
-    elif backend_type == "grok":
-        api_key = kwargs.get("api_key") or os.getenv("XAI_API_KEY")
-        if not api_key:
-            raise ConfigurationError(
-                "Grok API key not found. Set XAI_API_KEY or provide in config."
-            )
-        return GrokBackend(api_key=api_key)
 
-    elif backend_type == "claude":
-        api_key = kwargs.get("api_key") or os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ConfigurationError(
-                "Claude API key not found. Set ANTHROPIC_API_KEY or provide in config."
-            )
-        return ClaudeBackend(api_key=api_key)
+async def warmup_backends(agents: Dict[str, SingleAgent]) -> None:
+    """Warm up all agent backends concurrently before the first request.
 
-    elif backend_type == "gemini":
-        api_key = (
-            kwargs.get("api_key")
-            or os.getenv("GOOGLE_API_KEY")
-            or os.getenv("GEMINI_API_KEY")
+    Waits at most WARMUP_TIMEOUT_SECONDS; errors and slow warmups are ignored
+    and the first real request then connects itself.
+    """
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                *(agent.backend.warmup() for agent in agents.values()),
+                return_exceptions=True,
+            ),
+            timeout=WARMUP_TIMEOUT_SECONDS,
         )
-        if not api_key:
-            raise ConfigurationError(
-                "Gemini API key not found. Set GOOGLE_API_KEY or provide in config."
-            )
-        return GeminiBackend(api_key=api_key)
-
-    elif backend_type == "chatcompletion":
-        api_key = kwargs.get("api_key")
-        base_url = kwargs.get("base_url")
-
-        # Determine API key based on base URL if not explicitly provided
-        if not api_key:
-            if base_url and "cerebras.ai" in base_url:
-                api_key = os.getenv("CEREBRAS_API_KEY")
-                if not api_key:
-                    raise ConfigurationError(
-                        "Cerebras AI API key not found. Set CEREBRAS_API_KEY or provide in config."
-                    )
-            elif base_url and "z.ai" in base_url:
-                api_key = os.getenv("ZAI_API_KEY")
-                if not api_key:
-                    raise ConfigurationError(
-                        "ZAI API key not found. Set ZAI_API_KEY or provide in config."
-                    )
-
-        return ChatCompletionsBackend(api_key=api_key)
-
-    elif backend_type == "zai":
-        # ZAI uses OpenAI-compatible Chat Completions at a custom base_url
-        api_key = kwargs.get("api_key") or os.getenv("ZAI_API_KEY")
-        if not api_key:
-            raise ConfigurationError(
-                "ZAI API key not found. Set ZAI_API_KEY or provide in config."
-            )
-        return ChatCompletionsBackend(api_key=api_key)
-
-        # ChatCompletionsBackend now handles provider-specific API key detection internally
-        # Just pass through all kwargs including api_key and base_url
-        return ChatCompletionsBackend(**kwargs)
-
-    elif backend_type == "lmstudio":
-        # LM Studio local server (OpenAI-compatible). Defaults handled by backend.
-        return LMStudioBackend(**kwargs)
-
-    elif backend_type == "claude_code":
-        # ClaudeCodeBackend using claude-code-sdk-python
-        # Authentication handled by backend (API key or subscription)
-
-        # Validate claude-code-sdk availability
-        try:
-            import claude_code_sdk
-        except ImportError:
-            raise ConfigurationError(
-                "claude-code-sdk not found. Install with: pip install claude-code-sdk"
-            )
-
-        return ClaudeCodeBackend(**kwargs)
-
-    else:
-        raise ConfigurationError(f"Unsupported backend type: {backend_type}")
+    except asyncio.TimeoutError:
+        pass
 
 
 def create_agents_from_config(config: Dict[str, Any]) -> Dict[str, ConfigurableAgent]:
@@ -765,6 +823,9 @@ Environment Variables:
         if not agents:
             raise ConfigurationError("No agents configured")
 
+        # Open API connections up front so the first request reuses a warm one
+        await warmup_backends(agents)
+
         # Create timeout config from settings and put it in kwargs
         timeout_settings = config.get("timeout_settings", {})
         timeout_config = (
@@ -679,11 +679,12 @@ class Orchestrator(ChatAgent):
                 workflow_tool_found = False
 
                 async for chunk in chat_stream:
-                    if chunk.type == "content":
+                    chunk_type = chunk.type
+                    if chunk_type == "content":
                         response_text += chunk.content
                         # Stream agent content directly - source field handles attribution
                         yield ("content", chunk.content)
-                    elif chunk.type in [
+                    elif chunk_type in [
                         "reasoning",
                         "reasoning_done",
                         "reasoning_summary",
@@ -691,7 +692,7 @@ class Orchestrator(ChatAgent):
                     ]:
                         # Stream reasoning content as tuple format
                         reasoning_chunk = StreamChunk(
-                            type=chunk.type,
+                            type=chunk_type,
                             content=chunk.content,
                             source=agent_id,
                             reasoning_delta=getattr(chunk, "reasoning_delta", None),
@@ -707,9 +708,9 @@ class Orchestrator(ChatAgent):
                             summary_index=getattr(chunk, "summary_index", None),
                         )
                         yield ("reasoning", reasoning_chunk)
-                    elif chunk.type == "backend_status":
+                    elif chunk_type == "backend_status":
                         pass
-                    elif chunk.type == "tool_calls":
+                    elif chunk_type == "tool_calls":
                         # Use the correct tool_calls field
                         chunk_tool_calls = getattr(chunk, "tool_calls", []) or []
                         tool_calls.extend(chunk_tool_calls)
@@ -743,7 +744,7 @@ class Orchestrator(ChatAgent):
                                 )
                             else:
                                 yield ("content", f"🔧 Using {tool_name}")
-                    elif chunk.type == "error":
+                    elif chunk_type == "error":
                         # Stream error information to user interface
                         error_msg = (
                             getattr(chunk, "error", str(chunk.content))
@@ -1200,11 +1201,12 @@ class Orchestrator(ChatAgent):
         # Use agent's chat method with proper system message (reset chat for clean presentation)
         async for chunk in agent.chat(presentation_messages, reset_chat=True):
             # Use the same streaming approach as regular coordination
-            if chunk.type == "content" and chunk.content:
+            chunk_type = chunk.type
+            if chunk_type == "content" and chunk.content:
                 yield StreamChunk(
                     type="content", content=chunk.content, source=selected_agent_id
                 )
-            elif chunk.type in [
+            elif chunk_type in [
                 "reasoning",
                 "reasoning_done",
                 "reasoning_summary",
@@ -1212,7 +1214,7 @@ class Orchestrator(ChatAgent):
             ]:
                 # Stream reasoning content with proper attribution (same as main coordination)
                 reasoning_chunk = StreamChunk(
-                    type=chunk.type,
+                    type=chunk_type,
                     content=chunk.content,
                     source=selected_agent_id,
                     reasoning_delta=getattr(chunk, "reasoning_delta", None),
@@ -1229,7 +1231,7 @@ class Orchestrator(ChatAgent):
                 )
                 # Use the same format as main coordination for consistency
                 yield reasoning_chunk
-            elif chunk.type == "backend_status":
+            elif chunk_type == "backend_status":
                 import json
 
                 status_json = json.loads(chunk.content)
@@ -1243,9 +1245,9 @@ Final Session ID: {session_id}.
                     type="content", content=content, source=selected_agent_id
                 )
 
-            elif chunk.type == "done":
+            elif chunk_type == "done":
                 yield StreamChunk(type="done", source=selected_agent_id)
-            elif chunk.type == "error":
+            elif chunk_type == "error":
                 yield StreamChunk(
                     type="error", error=chunk.error, source=selected_agent_id
                 )
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ChatCompletionsBackend helpers.
+Exercises tool formatting without making API calls.
+"""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from massgen.backend.chat_completions import ChatCompletionsBackend
+
+
+def make_tool(name: str):
+    """Build a tool definition in Response API format."""
+    return {
+        "type": "function",
+        "name": name,
+        "description": f"{name} tool",
+        "parameters": {"type": "object", "properties": {}},
+    }
+
+
+def test_formatted_tools_are_reused_for_the_same_tools():
+    """The conversion runs once while the same tool objects are passed in."""
+    backend = ChatCompletionsBackend()
+    tools = [make_tool("vote"), make_tool("new_answer")]
+
+    with mock.patch.object(
+        backend,
+        "convert_tools_to_chat_completions_format",
+        wraps=backend.convert_tools_to_chat_completions_format,
+    ) as convert:
+        first = backend.get_formatted_tools(tools)
+        second = backend.get_formatted_tools(list(tools))
+
+    assert convert.call_count == 1
+    assert first == second
+    assert first[0]["function"]["name"] == "vote"
+    # Each call returns its own list so provider tools can be appended safely
+    first.append({"type": "web_search"})
+    assert len(backend.get_formatted_tools(tools)) == 2
+
+
+def test_formatted_tools_are_rebuilt_when_tools_change():
+    """A different tool list, or an explicit invalidation, rebuilds the conversion."""
+    backend = ChatCompletionsBackend()
+    tools = [make_tool("vote")]
+    backend.get_formatted_tools(tools)
+
+    changed = backend.get_formatted_tools(tools + [make_tool("new_answer")])
+    assert [t["function"]["name"] for t in changed] == ["vote", "new_answer"]
+
+    # In-place edits are only picked up after invalidate_formatted_tools()
+    backend.get_formatted_tools(tools)
+    tools[0]["description"] = "Cast a vote"
+    assert backend.get_formatted_tools(tools)[0]["function"]["description"] == (
+        "vote tool"
+    )
+    backend.invalidate_formatted_tools()
+    assert backend.get_formatted_tools(tools)[0]["function"]["description"] == (
+        "Cast a vote"
+    )
+
+
+def main():
+    """Run all ChatCompletionsBackend unit tests."""
+    tests = [
+        value
+        for name, value in globals().items()
+        if name.startswith("test_") and callable(value)
+    ]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 All {len(tests)} ChatCompletionsBackend tests passed")
+
+
+if __name__ == "__main__":
+    main()
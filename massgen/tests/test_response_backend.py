@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ResponseBackend stream handling.
+Drives stream_with_tools with a fake Response API client - no API calls are made.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest import mock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from massgen.backend import response
+from massgen.backend.response import ResponseBackend
+
+
+class FakeStream:
+    """Async iterator over a fixed list of Response API stream events."""
+
+    def __init__(self, events: List[Any]):
+        self._events = iter(events)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._events)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeResponses:
+    """Stand-in for client.responses that records every create() call."""
+
+    def __init__(self, events: List[Any]):
+        self.events = events
+        self.calls: List[Dict[str, Any]] = []
+
+    async def create(self, **api_params):
+        self.calls.append(api_params)
+        return FakeStream(self.events)
+
+
+def text_delta(delta: str):
+    return SimpleNamespace(type="response.output_text.delta", delta=delta)
+
+
+def reasoning_delta(delta: str):
+    return SimpleNamespace(type="response.reasoning_text.delta", delta=delta)
+
+
+def completed(output: List[Dict[str, Any]]):
+    return SimpleNamespace(
+        type="response.completed", response={"id": "resp_1", "output": output}
+    )
+
+
+def run_stream(
+    backend: ResponseBackend,
+    fake_responses: FakeResponses,
+    question: str = "Hi",
+    **kwargs,
+):
+    """Collect all chunks from one stream_with_tools call against the fake client."""
+    fake_client = SimpleNamespace(responses=fake_responses)
+
+    async def collect():
+        return [
+            chunk
+            async for chunk in backend.stream_with_tools(
+                [{"role": "user", "content": question}], [], **kwargs
+            )
+        ]
+
+    with mock.patch.object(response, "_get_shared_client", return_value=fake_client):
+        return asyncio.run(collect())
+
+
+def test_text_deltas_are_batched_by_size():
+    """Deltas are coalesced until TEXT_FLUSH_MAX_CHARS is reached."""
+    fake = FakeResponses([text_delta("Hel"), text_delta("lo "), text_delta("world")])
+
+    with mock.patch.object(response, "TEXT_FLUSH_MAX_CHARS", 6), mock.patch.object(
+        response, "TEXT_FLUSH_INTERVAL_SECONDS", 60
+    ):
+        chunks = run_stream(ResponseBackend(model="gpt-4o"), fake)
+
+    assert [(c.type, c.content) for c in chunks] == [
+        ("content", "Hello "),
+        ("content", "world"),
+    ]
+
+
+def test_text_is_flushed_before_other_events():
+    """Buffered text is emitted before a reasoning event to keep ordering."""
+    fake = FakeResponses(
+        [
+            text_delta("Let me "),
+            text_delta("think"),
+            reasoning_delta("step 1"),
+            text_delta("Done"),
+            completed([{"type": "message"}]),
+        ]
+    )
+
+    with mock.patch.object(response, "TEXT_FLUSH_INTERVAL_SECONDS", 60):
+        chunks = run_stream(ResponseBackend(model="gpt-4o"), fake)
+
+    assert [c.type for c in chunks] == [
+        "content",
+        "reasoning",
+        "content",
+        "complete_response",
+        "done",
+    ]
+    assert chunks[0].content == "Let me think"
+    assert chunks[1].reasoning_delta == "step 1"
+    assert chunks[2].content == "Done"
+
+
+def test_remaining_text_is_flushed_at_stream_end():
+    """Text buffered when the stream ends without response.completed is emitted."""
+    fake = FakeResponses([text_delta("partial "), text_delta("answer")])
+
+    with mock.patch.object(response, "TEXT_FLUSH_INTERVAL_SECONDS", 60):
+        chunks = run_stream(ResponseBackend(model="gpt-4o"), fake)
+
+    assert [(c.type, c.content) for c in chunks] == [("content", "partial answer")]
+
+
+def test_split_reasoning_effort():
+    """Only o-series model names have their effort suffix split off."""
+    split = response._split_reasoning_effort
+    assert split("o3-high") == ("o3", "high")
+    assert split("o4-mini-low") == ("o4-mini", "low")
+    assert split("o3-mini") == ("o3-mini", None)
+    assert split("omni-high") == ("omni-high", None)
+    assert split("gpt-4o-high") == ("gpt-4o-high", None)
+
+
+def test_reasoning_effort_is_sent_for_o_series_models():
+    """An effort suffix becomes the reasoning parameter of the request."""
+    fake = FakeResponses([completed([{"type": "message"}])])
+
+    run_stream(ResponseBackend(model="o4-mini-high"), fake)
+
+    assert fake.calls[0]["model"] == "o4-mini"
+    assert fake.calls[0]["reasoning"] == {"effort": "high"}
+
+
+def test_reasoning_effort_is_merged_into_reasoning_config():
+    """A configured reasoning dict keeps its settings and gains the model's effort."""
+    fake = FakeResponses([completed([{"type": "message"}])])
+    reasoning_config = {"summary": "auto"}
+    backend = ResponseBackend(model="o3-high", reasoning=reasoning_config)
+
+    run_stream(backend, fake)
+
+    assert fake.calls[0]["model"] == "o3"
+    assert fake.calls[0]["reasoning"] == {"effort": "high", "summary": "auto"}
+    assert reasoning_config == {"summary": "auto"}
+
+
+def test_response_cache_replays_identical_requests():
+    """A repeated request is served from the cache without calling the API."""
+    fake = FakeResponses(
+        [text_delta("Paris"), completed([{"type": "message", "id": "msg_1"}])]
+    )
+    backend = ResponseBackend(model="gpt-4o", enable_response_cache=True)
+
+    first = run_stream(backend, fake, question="Capital of France?")
+    second = run_stream(backend, fake, question="Capital of France?")
+
+    assert len(fake.calls) == 1
+    assert "enable_response_cache" not in fake.calls[0]
+    assert (backend.response_cache_misses, backend.response_cache_hits) == (1, 1)
+    assert [c.type for c in second] == ["content", "complete_response", "done"]
+    assert second[0].content == "Paris"
+    assert second[1].response == first[1].response
+
+
+def test_response_cache_misses_on_different_requests():
+    """Requests that differ in any parameter go to the API."""
+    fake = FakeResponses([text_delta("Answer"), completed([{"type": "message"}])])
+    backend = ResponseBackend(model="gpt-4o", enable_response_cache=True)
+
+    run_stream(backend, fake, question="First question")
+    run_stream(backend, fake, question="Second question")
+
+    assert len(fake.calls) == 2
+    assert (backend.response_cache_misses, backend.response_cache_hits) == (2, 0)
+
+
+def test_response_cache_skips_tool_call_responses():
+    """Responses containing tool calls are never replayed from the cache."""
+    fake = FakeResponses(
+        [completed([{"type": "function_call", "name": "vote", "arguments": "{}"}])]
+    )
+    backend = ResponseBackend(model="gpt-4o", enable_response_cache=True)
+
+    run_stream(backend, fake)
+    run_stream(backend, fake)
+
+    assert len(fake.calls) == 2
+    assert len(backend._response_cache) == 0
+    assert backend.response_cache_hits == 0
+
+
+def test_response_cache_evicts_least_recently_used():
+    """The cache holds at most RESPONSE_CACHE_MAX_ENTRIES responses."""
+    fake = FakeResponses([text_delta("Answer"), completed([{"type": "message"}])])
+    backend = ResponseBackend(model="gpt-4o", enable_response_cache=True)
+
+    with mock.patch.object(response, "RESPONSE_CACHE_MAX_ENTRIES", 2):
+        run_stream(backend, fake, question="a")
+        run_stream(backend, fake, question="b")
+        run_stream(backend, fake, question="a")  # hit - "a" becomes most recent
+        run_stream(backend, fake, question="c")  # evicts "b"
+        assert len(backend._response_cache) == 2
+
+        run_stream(backend, fake, question="a")
+        assert backend.response_cache_hits == 2
+        run_stream(backend, fake, question="b")
+
+    assert len(fake.calls) == 4
+    assert backend.response_cache_misses == 4
+
+
+@pytest.mark.skipif(not response.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_orjson_client_encodes_json_bodies():
+    """Plain JSON request bodies are encoded with orjson."""
+    client = response._OrjsonAsyncHttpxClient()
+    try:
+        request = client.build_request(
+            "POST", "https://api.example.com/v1/responses", json={"model": "gpt-4o"}
+        )
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.read()) == {"model": "gpt-4o"}
+    finally:
+        asyncio.run(client.aclose())
+
+
+def test_orjson_client_keeps_multipart_bodies():
+    """Requests with files/data are left to httpx's multipart encoding."""
+    client = response._OrjsonAsyncHttpxClient()
+    try:
+        request = client.build_request(
+            "POST",
+            "https://api.example.com/v1/files",
+            json={"purpose": "assistants"},
+            data={"purpose": "assistants"},
+            files={"file": ("notes.txt", b"hello")},
+        )
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        body = request.read()
+        assert b'name="purpose"' in body
+        assert b'filename="notes.txt"' in body
+    finally:
+        asyncio.run(client.aclose())
+
+
+def main():
+    """Run all ResponseBackend unit tests."""
+    tests = [
+        value
+        for name, value in globals().items()
+        if name.startswith("test_") and callable(value)
+    ]
+    skipped = 0
+    for test in tests:
+        # Honour pytest skipif marks (e.g. orjson not installed)
+        skip_marks = [
+            mark
+            for mark in getattr(test, "pytestmark", [])
+            if mark.name == "skipif" and mark.args[0]
+        ]
+        if skip_marks:
+            skipped += 1
+            print(f"⏭️  {test.__name__} skipped: {skip_marks[0].kwargs['reason']}")
+            continue
+        test()
+        print(f"✅ {test.__name__}")
+    print(
+        f"\n🎉 {len(tests) - skipped} ResponseBackend tests passed, {skipped} skipped"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -55,6 +55,13 @@ MODEL_MAPPINGS = {
     ],
 }
 
+# Reverse index of MODEL_MAPPINGS for constant-time model -> backend type lookup
+_MODEL_TO_BACKEND_TYPE = {
+    model: backend_type
+    for backend_type, models in MODEL_MAPPINGS.items()
+    for model in models
+}
+
 
 def get_backend_type_from_model(model: str) -> str:
     """
@@ -69,9 +76,7 @@ def get_backend_type_from_model(model: str) -> str:
     if not model:
         return "openai"  # Default to OpenAI
 
-    model_lower = model.lower()
-
-    for key, models in MODEL_MAPPINGS.items():
-        if model_lower in models:
-            return key
-    raise ValueError(f"Unknown model: {model}")
+    backend_type = _MODEL_TO_BACKEND_TYPE.get(model.lower())
+    if backend_type is None:
+        raise ValueError(f"Unknown model: {model}")
+    return backend_type